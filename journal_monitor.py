@@ -1,25 +1,60 @@
 import feedparser
 import smtplib
+import atexit
 import json
+import hashlib
 import os
+import re
+import sys
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 import logging
+import logging.handlers
+import mmap
+import queue
 from dotenv import load_dotenv
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, Set
 import time
-import requests.exceptions
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import requests
 
-# Set up logging
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional, snapshots are stored uncompressed without it
+    zstandard = None
+
+try:
+    import simdjson
+except ImportError:  # optional, uncompressed snapshots are parsed with json_loads instead
+    simdjson = None
+
+# Set up logging: callers only enqueue records, a background listener does the I/O
+log_queue = queue.Queue()
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+log_handlers = [logging.FileHandler('journal_monitor.log'), logging.StreamHandler()]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+# Flushes any queued records before the process exits, however the module is used
+atexit.register(log_listener.stop)
+log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+# getLevelName() maps known names to their number and anything else to a string
+log_level_valid = isinstance(logging.getLevelName(log_level), int)
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('journal_monitor.log'),
-        logging.StreamHandler()
-    ]
+    level=log_level if log_level_valid else logging.INFO,
+    format='%(message)s',  # the listener's handlers apply log_formatter
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+if not log_level_valid:
+    logging.warning("Unknown LOG_LEVEL %r, using INFO", os.environ["LOG_LEVEL"])
 
 JOURNAL_FEEDS = {
     "Journal of Machine Learning Research": "https://www.jmlr.org/jmlr.xml",
@@ -50,133 +85,486 @@ JOURNAL_FEEDS = {
     "Journal of Big Data": "https://journalofbigdata.springeropen.com/articles/most-recent/rss"
 }
 
+# Journal names are reused as keys throughout; share a single string object for each
+JOURNAL_FEEDS = {sys.intern(journal): url for journal, url in JOURNAL_FEEDS.items()}
+
 # Constants
-ARTICLE_STORE = "seen_articles.json"
-RETRY_ATTEMPTS = 3
-RETRY_DELAY = 5  # seconds
+SEEN_DIR = "seen"  # one snapshot + append log per journal, loaded on demand
+FEED_STATE = os.path.join(SEEN_DIR, "feeds.json")  # per-journal cache validators
+LEGACY_ARTICLE_STORE = "seen_articles.json"  # single-file store, migrated on first run
+SNAPSHOT_EXTENSION = ".json.zst" if zstandard is not None else ".json"
+COMPACTION_INTERVAL = 30 * 24 * 60 * 60  # seconds between snapshot rewrites
+RETRY_ATTEMPTS = 3  # network failures only; 304 Not Modified is not an error
+RETRY_DELAY = 5  # seconds, doubled after each failed attempt
+SMTP_KEEPALIVE = 60  # seconds between NOOPs while the daemon is idle
+SMTP_TIMEOUT = 30  # seconds
+REQUEST_TIMEOUT = 30  # seconds
+FETCH_CONCURRENCY = max(1, int(os.getenv("FETCH_CONCURRENCY", 8)))
+
+def entry_key(entry: feedparser.FeedParserDict, link: str) -> str:
+    """Return the stable identifier of a feed entry: its id or guid, else its stripped link."""
+    # Titles get corrected by publishers; ids and links are stable.
+    # str.strip() returns the string itself when there is nothing to
+    # strip, so the common well-formed case costs no copy.
+    entry_id = entry.get("id") or entry.get("guid")
+    return entry_id.strip() if entry_id else link
+
+def article_fingerprint(key: str) -> str:
+    """Return the short fixed-size identifier stored for a seen article."""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest()
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_atomically(path: str, data: bytes) -> None:
+    """Replace the file at path with data without leaving a partial file behind."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+def journal_store_paths(journal: str) -> Tuple[str, str]:
+    """Return the snapshot and append-log paths holding a journal's seen articles."""
+    slug = re.sub(r"[^a-z0-9]+", "-", journal.lower()).strip("-")
+    base = os.path.join(SEEN_DIR, slug)
+    return base + SNAPSHOT_EXTENSION, base + ".jsonl"
+
+def read_snapshot(snapshot_path: str) -> Set[str]:
+    """Read the fingerprints in a journal snapshot, whether it was stored compressed or not."""
+    base = snapshot_path[:-len(SNAPSHOT_EXTENSION)]
+    if os.path.exists(base + ".json.zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{base}.json.zst is zstd-compressed; install zstandard to read it")
+        with open(base + ".json.zst", "rb") as file:
+            try:
+                data = zstandard.ZstdDecompressor().decompress(file.read())
+            except zstandard.ZstdError as e:
+                # Report it like a JSON decode error so one bad file doesn't abort the run
+                raise ValueError(f"corrupt zstd data: {e}") from e
+        return set(json_loads(data))
+    if not os.path.exists(base + ".json"):
+        return set()
+    with open(base + ".json", "rb") as file:
+        if simdjson is None or os.fstat(file.fileno()).st_size == 0:
+            return set(json_loads(file.read()))
+        # Parse straight from the page cache instead of copying the file into a bytes object
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return set(simdjson.Parser().parse(mapped))
+
+def write_snapshot(snapshot_path: str, keys: Set[str]) -> None:
+    """Write a journal snapshot, zstd-compressed when zstandard is installed."""
+    data = json_dumps(sorted(keys))
+    if zstandard is not None:
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+    write_atomically(snapshot_path, data)
+    # Drop a snapshot left in the other format so only one is ever read
+    base = snapshot_path[:-len(SNAPSHOT_EXTENSION)]
+    for extension in (".json", ".json.zst"):
+        if extension != SNAPSHOT_EXTENSION and os.path.exists(base + extension):
+            os.remove(base + extension)
+
+@lru_cache(maxsize=8)
+def load_seen_keys(journal: str) -> Set[str]:
+    """Load the fingerprints seen for a journal from its snapshot and append log.
+
+    The returned set is cached and updated in place as new articles are
+    recorded. Every addition is also appended to the journal's log, so an
+    evicted entry reloads to the same contents.
+    """
+    snapshot_path, log_path = journal_store_paths(journal)
+    keys = set()
+    try:
+        keys = read_snapshot(snapshot_path)
+    except ValueError as e:  # json, orjson, simdjson and (wrapped) zstd errors
+        logging.error("Error reading snapshot %s: %s", snapshot_path, e)
+
+    if os.path.exists(log_path):
+        with open(log_path, "rb") as file:
+            for line_number, line in enumerate(file, 1):
+                try:
+                    keys.add(json_loads(line)["k"])
+                except (ValueError, KeyError):
+                    # Most likely a line cut short by an interrupted run
+                    logging.warning("Skipping malformed line %s in %s", line_number, log_path)
+    return keys
 
 class JournalMonitor:
     def __init__(self):
         load_dotenv()
         self.email_sender = os.getenv("EMAIL_SENDER")
         self.email_password = os.getenv("EMAIL_PASSWORD")
-        self.email_receiver = os.getenv("EMAIL_RECEIVER")
+        # Comma-separated; every recipient gets the same pre-rendered message
+        self.email_receivers = [
+            address.strip() for address in os.getenv("EMAIL_RECEIVER", "").split(",") if address.strip()
+        ]
         self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
         self.smtp_port = int(os.getenv("SMTP_PORT", 587))
+        self._smtp = None
+        # Shared by the fetch threads so connections to the same publisher are reused
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = feedparser.USER_AGENT
+        adapter = requests.adapters.HTTPAdapter(pool_connections=FETCH_CONCURRENCY, pool_maxsize=FETCH_CONCURRENCY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         
-        if not all([self.email_sender, self.email_password, self.email_receiver]):
+        if not all([self.email_sender, self.email_password, self.email_receivers]):
             raise ValueError("Missing required environment variables. Please check your .env file.")
 
-    def load_seen_articles(self) -> Dict:
-        """Load previously seen articles from JSON file with error handling."""
+    def load_feed_state(self) -> Dict[str, Dict]:
+        """Load the per-journal cache validators, migrating the legacy store if present."""
+        if not os.path.exists(FEED_STATE) and os.path.exists(LEGACY_ARTICLE_STORE):
+            self.migrate_legacy_store()
         try:
-            if os.path.exists(ARTICLE_STORE):
-                with open(ARTICLE_STORE, "r", encoding='utf-8') as file:
-                    return json.load(file)
-            return {}
+            if os.path.exists(FEED_STATE):
+                with open(FEED_STATE, "rb") as file:
+                    return {sys.intern(journal): record for journal, record in json_loads(file.read()).items()}
         except json.JSONDecodeError as e:
-            logging.error(f"Error reading JSON file: {e}")
-            return {}
+            logging.error("Error reading JSON file: %s", e)
+        return {}
 
-    def save_seen_articles(self, seen_articles: Dict) -> None:
-        """Save seen articles to JSON file with error handling."""
+    def save_feed_state(self, feed_state: Dict[str, Dict]) -> None:
+        """Save the per-journal cache validators with error handling."""
         try:
-            with open(ARTICLE_STORE, "w", encoding='utf-8') as file:
-                json.dump(seen_articles, file, indent=4, ensure_ascii=False)
+            os.makedirs(SEEN_DIR, exist_ok=True)
+            write_atomically(FEED_STATE, json_dumps(feed_state))
         except IOError as e:
-            logging.error(f"Error saving articles: {e}")
+            logging.error("Error saving feed state: %s", e)
+
+    def append_seen_keys(self, journal: str, keys: List[str]) -> None:
+        """Append newly seen article fingerprints to the journal's log."""
+        _, log_path = journal_store_paths(journal)
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        lines = b"".join(json_dumps({"k": key, "ts": timestamp}) + b"\n" for key in keys)
+        try:
+            os.makedirs(SEEN_DIR, exist_ok=True)
+            with open(log_path, "ab") as log_file:
+                log_file.write(lines)
+                log_file.flush()
+        except IOError as e:
+            logging.error("Error saving articles: %s", e)
+
+    def save_seen_keys(self, journal: str, keys: Set[str]) -> None:
+        """Write a full snapshot of a journal's seen articles and truncate its log."""
+        snapshot_path, log_path = journal_store_paths(journal)
+        try:
+            os.makedirs(SEEN_DIR, exist_ok=True)
+            write_snapshot(snapshot_path, keys)
+            # Only drop the log once its contents are safely in the snapshot
+            open(log_path, "w").close()
+        except IOError as e:
+            logging.error("Error saving articles: %s", e)
+
+    def compact_if_due(self, journal: str, keys: Set[str]) -> None:
+        """Fold a journal's append log into its snapshot once the snapshot is old enough."""
+        snapshot_path, log_path = journal_store_paths(journal)
+        if not os.path.exists(log_path) or os.path.getsize(log_path) == 0:
+            return
+        if os.path.exists(snapshot_path):
+            age = time.time() - os.path.getmtime(snapshot_path)
+            if age < COMPACTION_INTERVAL:
+                return
+        logging.info("Compacting seen articles log for %s", journal)
+        self.save_seen_keys(journal, keys)
+
+    def migrate_legacy_store(self) -> None:
+        """Split the single-file seen_articles.json ({journal: [titles]}) into per-journal files."""
+        logging.info("Migrating %s to per-journal files in %s/", LEGACY_ARTICLE_STORE, SEEN_DIR)
+        try:
+            with open(LEGACY_ARTICLE_STORE, "rb") as file:
+                stored = json_loads(file.read())
+        except ValueError as e:
+            logging.error("Error reading JSON file: %s", e)
+            return
+
+        for journal, titles in stored.items():
+            self.save_seen_keys(journal, {article_fingerprint(title) for title in titles})
+        # No keyed_by marker: these journals move to entry ids the next time their feed changes
+        self.save_feed_state({journal: {} for journal in stored})
+        os.replace(LEGACY_ARTICLE_STORE, LEGACY_ARTICLE_STORE + ".bak")
+
+    def download_feed(self, url: str, etag: Optional[str] = None, modified: Optional[str] = None,
+                      retries: int = RETRY_ATTEMPTS) -> Optional[requests.Response]:
+        """Download a feed with a conditional GET and exponential backoff on failures."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
 
-    def fetch_feed(self, url: str, retries: int = RETRY_ATTEMPTS) -> feedparser.FeedParserDict:
-        """Fetch RSS feed with retry mechanism."""
         for attempt in range(retries):
             try:
-                return feedparser.parse(url)
-            except Exception as e:
-                if attempt == retries - 1:
-                    logging.error(f"Failed to fetch feed after {retries} attempts: {e}")
-                    return feedparser.FeedParserDict()
-                time.sleep(RETRY_DELAY)
-        return feedparser.FeedParserDict()
-
-    def fetch_new_articles(self) -> List[Tuple[str, str, str]]:
-        """Fetch latest articles from RSS feeds with improved error handling."""
-        seen_articles = self.load_seen_articles()
-        new_articles = []
-
-        for journal, url in JOURNAL_FEEDS.items():
-            logging.info(f"Checking feed: {journal}")
-            feed = self.fetch_feed(url)
+                response = self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException as e:
+                status = e.response.status_code if e.response is not None else None
+                # Client errors (other than rate limiting) won't fix themselves on retry
+                retryable = status is None or status >= 500 or status == 429
+                if not retryable or attempt == retries - 1:
+                    logging.error("Failed to fetch feed %s after %s attempts: %s", url, attempt + 1, e)
+                    return None
+                time.sleep(RETRY_DELAY * 2 ** attempt)
+        return None
 
-            if not feed.entries:
-                logging.warning(f"No entries found for {journal}")
+    def fetch_feed(self, url: str, etag: Optional[str] = None, modified: Optional[str] = None,
+                   body_hash: Optional[str] = None, retries: int = RETRY_ATTEMPTS) -> feedparser.FeedParserDict:
+        """Download and parse an RSS feed.
+
+        Like feedparser.parse, the result carries ``status``, ``etag`` and
+        ``modified``, plus the ``sha256`` of the downloaded body. A status of
+        304 means the server reported the feed as unchanged, ``unchanged``
+        means the body matched ``body_hash`` and was not parsed, and a status
+        of None means the download failed. None of these carry entries.
+        """
+        response = self.download_feed(url, etag, modified, retries)
+        if response is None:
+            return feedparser.FeedParserDict(entries=[], status=None)
+        if response.status_code == 304:
+            return feedparser.FeedParserDict(entries=[], status=304, etag=etag, modified=modified, sha256=body_hash)
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if content_hash == body_hash:
+            feed = feedparser.FeedParserDict(entries=[], unchanged=True)
+        else:
+            # Pass the HTTP metadata along so relative links resolve against the
+            # feed URL and the Content-Type charset is honoured (feedparser
+            # expects lowercase header names)
+            headers = {name.lower(): value for name, value in response.headers.items()}
+            headers["content-location"] = response.url
+            feed = feedparser.parse(response.content, response_headers=headers)
+        feed.status = response.status_code
+        feed.etag = response.headers.get("ETag")
+        feed.modified = response.headers.get("Last-Modified")
+        feed.sha256 = content_hash
+        return feed
+
+    def update_feed_cache(self, record: Dict, feed: feedparser.FeedParserDict) -> bool:
+        """Remember the feed's validators and body hash; return whether they changed."""
+        cache = {"etag": feed.etag, "modified": feed.modified, "sha256": feed.sha256}
+        if all(record.get(field) == value for field, value in cache.items()):
+            return False
+        record.update(cache)
+        return True
+
+    def entries_signature(self, keys: List[str]) -> str:
+        """Hash the keys of all entries in a feed for a cheap change check."""
+        return hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()
+
+    def fetch_new_articles(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Fetch latest articles from RSS feeds, grouped by journal as (title, link) pairs."""
+        feed_state = self.load_feed_state()
+        state_changed = False
+        new_articles = {}
+
+        def fetch(item: Tuple[str, str]) -> Tuple[str, feedparser.FeedParserDict]:
+            journal, url = item
+            record = feed_state.get(journal, {})
+            return journal, self.fetch_feed(url, record.get("etag"), record.get("modified"), record.get("sha256"))
+
+        # Fetch all feeds in parallel; results are processed on this thread
+        # so the stores never need locking.
+        feeds = list(JOURNAL_FEEDS.items())
+        with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+            results = list(executor.map(fetch, feeds))
+
+        for journal, feed in results:
+            logging.info("Checking feed: %s", journal)
+
+            if feed.status == 304:
+                logging.info("Feed unchanged since last check: %s", journal)
                 continue
 
-            if journal not in seen_articles:
-                seen_articles[journal] = []
+            if feed.get("unchanged"):
+                logging.info("Feed content identical to last check: %s", journal)
+                state_changed |= self.update_feed_cache(feed_state[journal], feed)
+                continue
 
+            if not feed.entries:
+                logging.warning("No entries found for %s", journal)
+                continue
+
+            record = feed_state.setdefault(journal, {})
+            # Strip each entry and derive its key once; both the change check
+            # and the dedup below reuse them
+            entries = []
             for entry in feed.entries:
                 try:
                     article_title = entry.title.strip()
                     article_link = entry.link.strip()
-
-                    if article_title not in seen_articles[journal]:
-                        new_articles.append((journal, article_title, article_link))
-                        seen_articles[journal].append(article_title)
-                        logging.info(f"New article found: {article_title}")
+                    entries.append((entry_key(entry, article_link), article_title, article_link))
                 except AttributeError as e:
-                    logging.error(f"Error processing entry in {journal}: {e}")
+                    logging.error("Error processing entry in %s: %s", journal, e)
+
+            entries_signature = self.entries_signature([key for key, _, _ in entries])
+            if record.get("entries") == entries_signature:
+                # Body changed (e.g. a new build date) but the entries did not
+                logging.info("No new entries since last check: %s", journal)
+                state_changed |= self.update_feed_cache(record, feed)
+                continue
+
+            # Only journals whose feed actually changed have their history loaded
+            seen_keys = load_seen_keys(journal)
+            # Journals recorded before entry ids were used are still keyed by title
+            keyed_by_title = record.get("keyed_by") != "id"
+            candidates = [(article_fingerprint(key), title, link) for key, title, link in entries]
+
+            # Dedup the whole feed with one set difference instead of a lookup per entry
+            fresh_keys = {key for key, _, _ in candidates} - seen_keys
+            journal_articles = []
+            if fresh_keys:
+                seen_keys.update(fresh_keys)
+                self.append_seen_keys(journal, sorted(fresh_keys))
+                for article_key, article_title, article_link in candidates:
+                    # Removing the key also drops repeated entries within the same feed
+                    if article_key not in fresh_keys:
+                        continue
+                    fresh_keys.remove(article_key)
+                    if keyed_by_title and article_fingerprint(article_title) in seen_keys:
+                        continue
+                    journal_articles.append((article_title, article_link))
+                    logging.info("New article found: %s", article_title)
+
+            if journal_articles:
+                new_articles[journal] = journal_articles
 
-        self.save_seen_articles(seen_articles)
+            record["keyed_by"] = "id"
+            record["entries"] = entries_signature
+            self.update_feed_cache(record, feed)
+            state_changed = True
+            self.compact_if_due(journal, seen_keys)
+
+        if state_changed:
+            self.save_feed_state(feed_state)
         return new_articles
 
-    def send_email(self, new_articles: List[Tuple[str, str, str]]) -> None:
+    def send_email(self, new_articles: Dict[str, List[Tuple[str, str]]]) -> None:
         """Send an email notification with improved formatting and error handling."""
         if not new_articles:
             logging.info("No new articles to send")
             return
 
         subject = f"New Journal Articles Available - {datetime.now().strftime('%Y-%m-%d')}"
-        body = "Here are the latest articles:\n\n"
-
-        # Group articles by journal
-        articles_by_journal = {}
-        for journal, title, link in new_articles:
-            if journal not in articles_by_journal:
-                articles_by_journal[journal] = []
-            articles_by_journal[journal].append((title, link))
+        body_parts = ["Here are the latest articles:\n\n"]
 
         # Create formatted email body
-        for journal, articles in articles_by_journal.items():
-            body += f"\n{journal}:\n"
+        for journal, articles in new_articles.items():
+            body_parts.append(f"\n{journal}:\n")
             for title, link in articles:
-                body += f"- {title}\n  {link}\n"
+                body_parts.append(f"- {title}\n  {link}\n")
+        body = "".join(body_parts)
 
         msg = MIMEMultipart()
         msg["From"] = self.email_sender
-        msg["To"] = self.email_receiver
+        # Multiple recipients are only named in the SMTP envelope (BCC), not in the headers
+        msg["To"] = self.email_receivers[0] if len(self.email_receivers) == 1 else self.email_sender
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
+        # Render once; a retry after a dropped connection reuses the same bytes
+        message = msg.as_bytes()
 
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_sender, self.email_password)
-                server.send_message(msg)
-            logging.info(f"Email notification sent with {len(new_articles)} articles")
+            try:
+                refused = self.get_smtp().sendmail(self.email_sender, self.email_receivers, message)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+                # 421 is the server announcing it is closing the connection
+                if isinstance(e, smtplib.SMTPResponseException) and e.smtp_code != 421:
+                    raise
+                # The server dropped an idle connection; reconnect once and retry
+                self.close_smtp()
+                refused = self.get_smtp().sendmail(self.email_sender, self.email_receivers, message)
+            for address, (code, response) in refused.items():
+                logging.warning("Recipient %s refused by SMTP server: %s %s",
+                                address, code, response.decode("utf-8", "replace"))
+            article_count = sum(len(articles) for articles in new_articles.values())
+            logging.info("Email notification sent with %s articles", article_count)
         except Exception as e:
-            logging.error(f"Failed to send email: {str(e)}")
+            logging.error("Failed to send email: %s", e)
             raise
 
+    def get_smtp(self) -> smtplib.SMTP:
+        """Return the open SMTP connection, connecting and logging in if needed."""
+        if self._smtp is None:
+            if self.smtp_port == 465:
+                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+            else:
+                server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+            try:
+                if self.smtp_port != 465:
+                    server.starttls()
+                server.login(self.email_sender, self.email_password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+
+    def close_smtp(self) -> None:
+        """Close the SMTP connection if one is open."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                # quit() only closes the socket once QUIT succeeds
+                self._smtp.close()
+            self._smtp = None
+
+    def keep_smtp_alive(self, duration: float) -> None:
+        """Sleep for the given number of seconds, sending NOOPs on an open SMTP connection."""
+        deadline = time.monotonic() + duration
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(SMTP_KEEPALIVE, remaining))
+            if self._smtp is not None:
+                try:
+                    alive = self._smtp.noop()[0] == 250
+                except (smtplib.SMTPException, OSError):
+                    alive = False
+                if not alive:
+                    # Reconnect lazily on the next send
+                    self.close_smtp()
+
+    def daemon_loop(self, interval: int) -> None:
+        """Check feeds every ``interval`` seconds, keeping the SMTP connection open between runs."""
+        logging.info("Running as daemon, checking feeds every %s seconds", interval)
+        try:
+            while True:
+                try:
+                    new_articles = self.fetch_new_articles()
+                    self.send_email(new_articles)
+                except Exception as e:
+                    logging.error("Error during scheduled check: %s", e)
+                self.keep_smtp_alive(interval)
+        finally:
+            self.close_smtp()
+
 def main():
     """Main function with error handling."""
     try:
         monitor = JournalMonitor()
         logging.info("Starting journal monitor...")
-        new_articles = monitor.fetch_new_articles()
-        monitor.send_email(new_articles)
+        interval = int(os.getenv("CHECK_INTERVAL", 0))
+        if interval > 0:
+            monitor.daemon_loop(interval)
+            return
+        try:
+            new_articles = monitor.fetch_new_articles()
+            monitor.send_email(new_articles)
+        finally:
+            monitor.close_smtp()
         logging.info("Journal monitor completed successfully")
     except Exception as e:
-        logging.error(f"Critical error in main execution: {e}")
+        logging.error("Critical error in main execution: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -0,0 +1,317 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+import journal_monitor as jm
+
+FEED_URL = "https://journal.example/feed.rss"
+JOURNAL = "Test Journal"
+
+
+def rss(*items, build_date="Mon, 01 Jan 2024 00:00:00 GMT"):
+    """Render an RSS 2.0 feed from (guid, title, link) tuples."""
+    body = "".join(
+        f"<item><guid isPermaLink=\"false\">{guid}</guid><title>{title}</title><link>{link}</link></item>"
+        for guid, title, link in items
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>'
+        f"<lastBuildDate>{build_date}</lastBuildDate>{body}</channel></rss>"
+    ).encode("utf-8")
+
+
+class FakeResponse:
+    def __init__(self, url, status_code, content, headers):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers)
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves one feed body, answering conditional requests like a real server."""
+
+    def __init__(self):
+        self.body = b""
+        self.etag = None
+        self.requests = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests += 1
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(url, 304, b"", {})
+        response_headers = {"Content-Type": "application/rss+xml; charset=utf-8"}
+        if self.etag:
+            response_headers["ETag"] = self.etag
+        return FakeResponse(url, 200, self.body, response_headers)
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EMAIL_SENDER", "sender@example.com")
+    monkeypatch.setenv("EMAIL_PASSWORD", "secret")
+    monkeypatch.setenv("EMAIL_RECEIVER", "receiver@example.com")
+    monkeypatch.setattr(jm, "JOURNAL_FEEDS", {JOURNAL: FEED_URL})
+    # Cached journal histories belong to the previous test's directory
+    jm.load_seen_keys.cache_clear()
+    monitor = jm.JournalMonitor()
+    monitor._session = FakeSession()
+    yield monitor
+    jm.load_seen_keys.cache_clear()
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    parse = jm.feedparser.parse
+
+    def counting_parse(*args, **kwargs):
+        calls.append(args)
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(jm.feedparser, "parse", counting_parse)
+    return calls
+
+
+class FakeSMTP:
+    """Records what is sent; ``failures`` are raised by the next sendmail calls."""
+
+    connections = []
+    failures = []
+    refused = {}
+    noop_code = 250
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.closed = False
+        FakeSMTP.connections.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def sendmail(self, sender, receivers, message):
+        if FakeSMTP.failures:
+            raise FakeSMTP.failures.pop(0)
+        self.sent.append((sender, receivers, message))
+        return FakeSMTP.refused
+
+    def noop(self):
+        return FakeSMTP.noop_code, b"OK"
+
+    def quit(self):
+        self.closed = True
+
+    close = quit
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    monkeypatch.setattr(FakeSMTP, "connections", [])
+    monkeypatch.setattr(FakeSMTP, "failures", [])
+    monkeypatch.setattr(jm.smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(jm.smtplib, "SMTP_SSL", FakeSMTP)
+    return FakeSMTP
+
+
+def titles(new_articles):
+    return [title for title, _ in new_articles.get(JOURNAL, [])]
+
+
+def test_new_articles_reported_once(monitor):
+    monitor._session.body = rss(("id-1", "First", "https://journal.example/1"))
+    assert monitor.fetch_new_articles() == {JOURNAL: [("First", "https://journal.example/1")]}
+
+    jm.load_seen_keys.cache_clear()
+    monitor._session.body = rss(("id-1", "First", "https://journal.example/1"), build_date="later")
+    assert monitor.fetch_new_articles() == {}
+
+
+def test_migrates_baseline_title_store(monitor):
+    with open(jm.LEGACY_ARTICLE_STORE, "w", encoding="utf-8") as file:
+        json.dump({JOURNAL: ["First", "Second"]}, file)
+    monitor._session.body = rss(
+        ("id-1", "First", "https://journal.example/1"),
+        ("id-2", "Second", "https://journal.example/2"),
+        ("id-3", "Third", "https://journal.example/3"),
+    )
+
+    assert titles(monitor.fetch_new_articles()) == ["Third"]
+    assert os.path.exists(jm.LEGACY_ARTICLE_STORE + ".bak")
+    assert not os.path.exists(jm.LEGACY_ARTICLE_STORE)
+    assert monitor.load_feed_state()[JOURNAL]["keyed_by"] == "id"
+
+
+def test_title_history_moved_to_ids_is_not_reported_again(monitor):
+    with open(jm.LEGACY_ARTICLE_STORE, "w", encoding="utf-8") as file:
+        json.dump({JOURNAL: ["First"]}, file)
+    monitor._session.body = rss(("id-1", "First", "https://journal.example/1"))
+    assert monitor.fetch_new_articles() == {}
+
+    # The publisher corrects the title; the entry id identifies it as already seen
+    jm.load_seen_keys.cache_clear()
+    monitor._session.body = rss(
+        ("id-1", "First (corrected)", "https://journal.example/1"),
+        ("id-2", "Second", "https://journal.example/2"),
+    )
+    assert titles(monitor.fetch_new_articles()) == ["Second"]
+
+
+def test_not_modified_feed_is_skipped(monitor, parse_calls):
+    monitor._session.etag = '"v1"'
+    monitor._session.body = rss(("id-1", "First", "https://journal.example/1"))
+    monitor.fetch_new_articles()
+    parse_calls.clear()
+
+    assert monitor.fetch_new_articles() == {}
+    assert parse_calls == []
+
+
+def test_identical_body_is_not_parsed(monitor, parse_calls):
+    monitor._session.body = rss(("id-1", "First", "https://journal.example/1"))
+    monitor.fetch_new_articles()
+    parse_calls.clear()
+
+    assert monitor.fetch_new_articles() == {}
+    assert parse_calls == []
+
+
+def test_entry_replaced_in_middle_of_feed_is_reported(monitor):
+    first = ("id-1", "First", "https://journal.example/1")
+    last = ("id-3", "Last", "https://journal.example/3")
+    monitor._session.body = rss(first, ("id-2", "Middle", "https://journal.example/2"), last)
+    monitor.fetch_new_articles()
+
+    monitor._session.body = rss(first, ("id-4", "New middle", "https://journal.example/4"), last)
+    assert titles(monitor.fetch_new_articles()) == ["New middle"]
+
+
+def test_relative_links_resolve_against_feed_url(monitor):
+    monitor._session.body = rss(("id-1", "First", "/articles/1"))
+    assert monitor.fetch_new_articles() == {JOURNAL: [("First", "https://journal.example/articles/1")]}
+
+
+def test_log_replay_skips_truncated_and_invalid_lines(monitor):
+    _, log_path = jm.journal_store_paths(JOURNAL)
+    os.makedirs(jm.SEEN_DIR)
+    with open(log_path, "wb") as file:
+        file.write(b'{"k":"aaa","ts":"2024-01-01T00:00:00"}\n')
+        file.write(b'{"ts":"2024-01-01T00:00:00"}\n')
+        file.write(b'{"k":"bbb","ts":"2024-01-01T00:00:00"}\n')
+        file.write(b'{"k":"cc')
+
+    assert jm.load_seen_keys(JOURNAL) == {"aaa", "bbb"}
+
+
+def test_compaction_folds_log_into_snapshot(monitor, monkeypatch):
+    monkeypatch.setattr(jm, "COMPACTION_INTERVAL", 0)
+    monitor._session.body = rss(("id-1", "First", "https://journal.example/1"))
+    monitor.fetch_new_articles()
+
+    snapshot_path, log_path = jm.journal_store_paths(JOURNAL)
+    assert os.path.getsize(log_path) == 0
+    jm.load_seen_keys.cache_clear()
+    assert jm.load_seen_keys(JOURNAL) == {jm.article_fingerprint("id-1")}
+
+
+@pytest.mark.parametrize("failure", [
+    jm.smtplib.SMTPServerDisconnected("Connection unexpectedly closed"),
+    jm.smtplib.SMTPSenderRefused(421, b"Service not available, closing channel", "sender@example.com"),
+])
+def test_dropped_smtp_connection_is_reopened_and_message_resent(monitor, fake_smtp, failure):
+    fake_smtp.failures.append(failure)
+    monitor.send_email({JOURNAL: [("First", "https://journal.example/1")]})
+
+    stale, fresh = fake_smtp.connections
+    assert stale.closed and not fresh.closed
+    [(sender, receivers, message)] = fresh.sent
+    assert receivers == ["receiver@example.com"]
+    assert b"https://journal.example/1" in message
+
+
+def test_other_smtp_errors_are_not_retried(monitor, fake_smtp):
+    fake_smtp.failures.append(jm.smtplib.SMTPSenderRefused(550, b"Rejected", "sender@example.com"))
+    with pytest.raises(jm.smtplib.SMTPSenderRefused):
+        monitor.send_email({JOURNAL: [("First", "https://journal.example/1")]})
+    assert len(fake_smtp.connections) == 1
+
+
+def test_keepalive_closes_connection_on_failed_noop(monitor, fake_smtp, monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(jm.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(jm.time, "sleep", lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+    monkeypatch.setattr(fake_smtp, "noop_code", 421)
+    server = monitor.get_smtp()
+
+    monitor.keep_smtp_alive(jm.SMTP_KEEPALIVE)
+    assert server.closed
+    assert monitor._smtp is None
+
+
+def test_multiple_recipients_are_bcc_and_refusals_logged(monitor, fake_smtp, monkeypatch, caplog):
+    monitor.email_receivers = ["a@example.com", "b@example.com"]
+    monkeypatch.setattr(fake_smtp, "refused", {"b@example.com": (550, b"No such user")})
+    with caplog.at_level("WARNING"):
+        monitor.send_email({JOURNAL: [("First", "https://journal.example/1")]})
+
+    [(sender, receivers, message)] = fake_smtp.connections[0].sent
+    assert receivers == ["a@example.com", "b@example.com"]
+    assert b"To: sender@example.com" in message
+    assert b"a@example.com" not in message
+    assert "b@example.com refused by SMTP server: 550 No such user" in caplog.text
+
+
+def test_snapshot_round_trip(monitor):
+    snapshot_path, _ = jm.journal_store_paths(JOURNAL)
+    os.makedirs(jm.SEEN_DIR)
+    jm.write_snapshot(snapshot_path, {"aaa", "bbb"})
+    assert jm.read_snapshot(snapshot_path) == {"aaa", "bbb"}
+
+
+@pytest.mark.skipif(jm.zstandard is None, reason="zstandard is not installed")
+def test_plain_snapshot_is_converted_to_zstd(monitor):
+    snapshot_path, _ = jm.journal_store_paths(JOURNAL)
+    plain_path = snapshot_path[:-len(".json.zst")] + ".json"
+    os.makedirs(jm.SEEN_DIR)
+    with open(plain_path, "w", encoding="utf-8") as file:
+        json.dump(["aaa"], file)
+
+    keys = jm.read_snapshot(snapshot_path) | {"bbb"}
+    jm.write_snapshot(snapshot_path, keys)
+    assert not os.path.exists(plain_path)
+    assert jm.read_snapshot(snapshot_path) == {"aaa", "bbb"}
+
+
+def test_smtp_uses_starttls_by_default_and_ssl_on_port_465(monitor, fake_smtp, monkeypatch):
+    class FakeSMTPSSL(fake_smtp):
+        def starttls(self):
+            raise AssertionError("STARTTLS on an implicit TLS connection")
+
+    monkeypatch.setattr(jm.smtplib, "SMTP_SSL", FakeSMTPSSL)
+    assert monitor.smtp_port == 587
+    assert type(monitor.get_smtp()) is fake_smtp
+
+    monitor.close_smtp()
+    monitor.smtp_port = 465
+    assert type(monitor.get_smtp()) is FakeSMTPSSL
+
+
+def test_unknown_log_level_falls_back_to_info(tmp_path):
+    env = dict(os.environ, LOG_LEVEL="verbose", PYTHONPATH=os.path.dirname(os.path.abspath(jm.__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", "import journal_monitor, logging; print(logging.getLogger().level)"],
+        cwd=tmp_path, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == str(jm.logging.INFO)
+    assert "Unknown LOG_LEVEL 'verbose', using INFO" in result.stderr